@@ -4,28 +4,94 @@ This module is designed to run on Vercel.  It exposes a single handler
 function compatible with Vercel's Python runtime.  The handler inspects the
 incoming query parameters and dispatches to the appropriate
 ``GPlayScraper`` method before returning a JSON response.
+
+Responses are encoded with ``orjson``, which the deployment installs from
+``api/requirements.txt``; the standard library is used if it is missing.
 """
 
 from __future__ import annotations
 
 import json
-from typing import Callable, Dict, Iterable, Tuple
+import os
+import re
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Protocol, Tuple, Union
 
 from gplay_scraper import GPlayScraper
 from gplay_scraper.config import Config
 from gplay_scraper.exceptions import GPlayScraperError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+# ASCII output lets the stdlib use its C string encoder; the \uXXXX
+# escapes make non-Latin payloads slightly larger but remain valid JSON.
+# ``default=dict`` lets the read-only (MappingProxyType) constants encode.
+_encode = json.JSONEncoder(ensure_ascii=True, separators=(",", ":"), default=dict).encode
+
+
+def _dumps(payload: object) -> bytes:
+    if orjson is not None:
+        body: bytes = orjson.dumps(payload, default=dict)
+        return body
+    return _encode(payload).encode()
+
 
 scraper = GPlayScraper()
 
-JsonDict = Dict[str, object]
+JsonDict = Mapping[str, object]
+QueryArgs = Mapping[str, str]
 HandlerResult = Tuple[int, JsonDict]
+ResponseBody = Union[bytes, Iterator[bytes]]
+Response = Tuple[ResponseBody, int, Mapping[str, str]]
+
+
+class Request(Protocol):
+    """The parts of the runtime's request object the handler relies on."""
+
+    method: str
+    args: QueryArgs
+
+
+# Shared across requests, so exposed read-only to the runtime.
+_BASE_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+})
+_CORS_HEADERS: Mapping[str, str] = MappingProxyType({
+    **_BASE_HEADERS,
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+})
+# CORS preflights are always identical, so the whole response is prebuilt.
+_OPTIONS_RESPONSE: Response = (b"", 204, _CORS_HEADERS)
+
+# Prebuilt payloads for the common bad-request paths, read-only like the headers.
+_ERR_MISSING_ACTION: JsonDict = MappingProxyType({"error": "Missing 'action' query parameter."})
+_ERR_MISSING_APP_ID: JsonDict = MappingProxyType({"error": "Missing required 'appId' parameter."})
+_ERR_MISSING_QUERY: JsonDict = MappingProxyType({"error": "Missing required 'query' parameter."})
+_ERR_MISSING_DEVELOPER_ID: JsonDict = MappingProxyType({"error": "Missing required 'developerId' parameter."})
+
+# Responses whose ``data`` list is longer than this are streamed, in chunks
+# of about ``_STREAM_CHUNK_SIZE`` encoded bytes.
+_STREAM_THRESHOLD = 100
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Empty ``lang``/``country`` values fall back to these as well.
+_LOCALE_DEFAULTS: Tuple[str, str] = (Config.DEFAULT_LANGUAGE, Config.DEFAULT_COUNTRY)
 
+_FIELD_SPLIT = re.compile(r"\s*,\s*")
 
-def _parse_fields(raw: str | None) -> Iterable[str]:
+
+def _parse_fields(raw: str | None) -> List[str]:
     if not raw:
         return []
-    return [field.strip() for field in raw.split(",") if field.strip()]
+    return [field for field in _FIELD_SPLIT.split(raw.strip()) if field]
 
 
 def _parse_int(value: str | None, default: int) -> int:
@@ -37,102 +103,139 @@ def _parse_int(value: str | None, default: int) -> int:
         return default
 
 
-def _handle_app(args) -> HandlerResult:
+# Seconds a scraper result is reused for identical requests (0 disables).
+_CACHE_TTL = _parse_int(os.environ.get("GPLAY_API_CACHE_TTL"), 300)
+_CACHE_MAXSIZE = 256
+
+# (method, *args) -> (expires_at, result), oldest first.
+_cache: "OrderedDict[Tuple[object, ...], Tuple[float, object]]" = OrderedDict()
+
+
+def _call(method: str, *args: object) -> object:
+    """Invoke a scraper method, reusing its result for up to ``_CACHE_TTL`` seconds.
+
+    The scraper reports network and rate-limit failures by returning ``[]`` or
+    ``None`` rather than raising, so empty results are never stored.  The
+    arguments form the cache key and must be hashable (pass fields as a tuple).
+    """
+    fetch = getattr(scraper, method)
+    if _CACHE_TTL <= 0:
+        return fetch(*args)
+
+    key = (method,) + args
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > now:
+        _cache.move_to_end(key)
+        return entry[1]
+
+    result = fetch(*args)
+    if not result:
+        _cache.pop(key, None)
+        return result
+
+    _cache[key] = (now + _CACHE_TTL, result)
+    _cache.move_to_end(key)
+    if len(_cache) > _CACHE_MAXSIZE:
+        _cache.popitem(last=False)
+    return result
+
+
+def _handle_app(args: QueryArgs) -> HandlerResult:
     app_id = args.get("appId")
     if not app_id:
-        return 400, {"error": "Missing required 'appId' parameter."}
+        return 400, _ERR_MISSING_APP_ID
 
-    lang = args.get("lang", Config.DEFAULT_LANGUAGE)
-    country = args.get("country", Config.DEFAULT_COUNTRY)
+    lang = args.get("lang") or _LOCALE_DEFAULTS[0]
+    country = args.get("country") or _LOCALE_DEFAULTS[1]
     assets = args.get("assets") or None
-    fields = list(_parse_fields(args.get("fields")))
+    fields = _parse_fields(args.get("fields"))
 
     if fields:
-        data = scraper.app_get_fields(app_id, fields, lang, country, assets)
+        data = _call("app_get_fields", app_id, tuple(fields), lang, country, assets)
     else:
-        data = scraper.app_analyze(app_id, lang, country, assets)
+        data = _call("app_analyze", app_id, lang, country, assets)
     return 200, {"data": data}
 
 
-def _handle_search(args) -> HandlerResult:
+def _handle_search(args: QueryArgs) -> HandlerResult:
     query = args.get("query")
     if not query:
-        return 400, {"error": "Missing required 'query' parameter."}
+        return 400, _ERR_MISSING_QUERY
 
     count = _parse_int(args.get("count"), Config.DEFAULT_SEARCH_COUNT)
-    lang = args.get("lang", Config.DEFAULT_LANGUAGE)
-    country = args.get("country", Config.DEFAULT_COUNTRY)
-    fields = list(_parse_fields(args.get("fields")))
+    lang = args.get("lang") or _LOCALE_DEFAULTS[0]
+    country = args.get("country") or _LOCALE_DEFAULTS[1]
+    fields = _parse_fields(args.get("fields"))
 
     if fields:
-        data = scraper.search_get_fields(query, fields, count, lang, country)
+        data = _call("search_get_fields", query, tuple(fields), count, lang, country)
     else:
-        data = scraper.search_analyze(query, count, lang, country)
+        data = _call("search_analyze", query, count, lang, country)
     return 200, {"data": data}
 
 
-def _handle_reviews(args) -> HandlerResult:
+def _handle_reviews(args: QueryArgs) -> HandlerResult:
     app_id = args.get("appId")
     if not app_id:
-        return 400, {"error": "Missing required 'appId' parameter."}
+        return 400, _ERR_MISSING_APP_ID
 
     count = _parse_int(args.get("count"), Config.DEFAULT_REVIEWS_COUNT)
-    lang = args.get("lang", Config.DEFAULT_LANGUAGE)
-    country = args.get("country", Config.DEFAULT_COUNTRY)
+    lang = args.get("lang") or _LOCALE_DEFAULTS[0]
+    country = args.get("country") or _LOCALE_DEFAULTS[1]
     sort = args.get("sort", Config.DEFAULT_REVIEWS_SORT)
-    fields = list(_parse_fields(args.get("fields")))
+    fields = _parse_fields(args.get("fields"))
 
     if fields:
-        data = scraper.reviews_get_fields(app_id, fields, count, lang, country, sort)
+        data = _call("reviews_get_fields", app_id, tuple(fields), count, lang, country, sort)
     else:
-        data = scraper.reviews_analyze(app_id, count, lang, country, sort)
+        data = _call("reviews_analyze", app_id, count, lang, country, sort)
     return 200, {"data": data}
 
 
-def _handle_developer(args) -> HandlerResult:
+def _handle_developer(args: QueryArgs) -> HandlerResult:
     developer_id = args.get("developerId")
     if not developer_id:
-        return 400, {"error": "Missing required 'developerId' parameter."}
+        return 400, _ERR_MISSING_DEVELOPER_ID
 
     count = _parse_int(args.get("count"), Config.DEFAULT_DEVELOPER_COUNT)
-    lang = args.get("lang", Config.DEFAULT_LANGUAGE)
-    country = args.get("country", Config.DEFAULT_COUNTRY)
-    fields = list(_parse_fields(args.get("fields")))
+    lang = args.get("lang") or _LOCALE_DEFAULTS[0]
+    country = args.get("country") or _LOCALE_DEFAULTS[1]
+    fields = _parse_fields(args.get("fields"))
 
     if fields:
-        data = scraper.developer_get_fields(developer_id, fields, count, lang, country)
+        data = _call("developer_get_fields", developer_id, tuple(fields), count, lang, country)
     else:
-        data = scraper.developer_analyze(developer_id, count, lang, country)
+        data = _call("developer_analyze", developer_id, count, lang, country)
     return 200, {"data": data}
 
 
-ACTION_MAP: Dict[str, Callable] = {
+def _handle_warmup(args: QueryArgs) -> HandlerResult:
+    # Pinged on a schedule so Vercel keeps a warm instance around.
+    return 200, {"data": {"status": "warm"}}
+
+
+ACTION_MAP: Dict[str, Callable[[QueryArgs], HandlerResult]] = {
     "app": _handle_app,
     "search": _handle_search,
     "reviews": _handle_reviews,
     "developer": _handle_developer,
+    "warmup": _handle_warmup,
 }
 
 
-def handler(request):  # type: ignore[override]
+def handler(request: Request) -> Response:
     """Main entrypoint for the Vercel serverless function."""
 
     if request.method == "OPTIONS":
-        return _build_response(
-            204,
-            {},
-            extra_headers={
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "GET, OPTIONS",
-                "Access-Control-Allow-Headers": "*",
-            },
-        )
-
-    action = (request.args.get("action") or "").lower()
+        return _OPTIONS_RESPONSE
+
+    action = request.args.get("action") or ""
     if not action:
-        return _build_response(400, {"error": "Missing 'action' query parameter."})
+        return _build_response(400, _ERR_MISSING_ACTION)
 
-    handler_fn = ACTION_MAP.get(action)
+    # Actions are almost always sent lowercase; only fold case on a miss.
+    handler_fn = ACTION_MAP.get(action) or ACTION_MAP.get(action.lower())
     if not handler_fn:
         return _build_response(400, {"error": f"Unsupported action '{action}'."})
 
@@ -148,9 +251,33 @@ def handler(request):  # type: ignore[override]
     return _build_response(status, payload)
 
 
-def _build_response(status: int, payload: JsonDict, *, extra_headers: Dict[str, str] | None = None):
-    body = json.dumps(payload, ensure_ascii=False)
-    headers = {"Content-Type": "application/json", "Access-Control-Allow-Origin": "*"}
-    if extra_headers:
-        headers.update(extra_headers)
-    return body, status, headers
+def _iter_data_chunks(items: List[object]) -> Iterator[bytes]:
+    """Yield ``{"data": items}`` as JSON in chunks of roughly ``_STREAM_CHUNK_SIZE`` bytes.
+
+    Items are batched so a few hundred results cost a handful of writes, not
+    one per item.  This only avoids holding the whole encoded body at once;
+    ``items`` itself stays in memory (and may also sit in the result cache).
+    Because the 200 status is already sent, an item that fails to encode
+    truncates the body instead of producing a 500.
+    """
+    buffer = bytearray(b'{"data":[')
+    for index, item in enumerate(items):
+        if index:
+            buffer += b","
+        buffer += _dumps(item)
+        if len(buffer) >= _STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]}"
+    yield bytes(buffer)
+
+
+def _build_response(status: int, payload: JsonDict) -> Response:
+    body: ResponseBody
+    data = payload.get("data")
+    if isinstance(data, list) and len(data) > _STREAM_THRESHOLD and len(payload) == 1:
+        # Encode large result lists item by item; see _iter_data_chunks.
+        body = _iter_data_chunks(data)
+    else:
+        body = _dumps(payload)
+    return body, status, _BASE_HEADERS
@@ -10,25 +10,102 @@ as much as possible and renders JSON responses in a scrollable viewer.
 from __future__ import annotations
 
 import json
-import threading
-import tkinter as tk
-from tkinter import messagebox, ttk
-from typing import Any, Iterable
+import re
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from gplay_scraper import GPlayScraper
 from gplay_scraper.config import Config
 from gplay_scraper.exceptions import GPlayScraperError
 
+if TYPE_CHECKING:
+    import tkinter as tk
+    from tkinter import messagebox, ttk
+
+
+_FIELD_SPLIT = re.compile(r"\s*,\s*")
+
+
+def _load_tkinter() -> None:
+    """Import tkinter on first use so importing this module stays cheap."""
+    global tk, messagebox, ttk
+    import tkinter as tk
+    from tkinter import messagebox, ttk
+
+
+# Frozen dataclasses with hand-written __slots__ (dataclass(slots=True) needs
+# Python 3.10): immutable, no per-instance __dict__, field names kept.
+@dataclass(frozen=True)
+class AppQuery:
+    """Inputs for the App tab's "Get Fields" action."""
+
+    __slots__ = ("app_id", "lang", "country", "assets", "fields")
+
+    app_id: str
+    lang: str
+    country: str
+    assets: str | None
+    fields: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """Inputs for the Search tab's "Get Fields" action."""
+
+    __slots__ = ("query", "count", "lang", "country", "fields")
+
+    query: str
+    count: int
+    lang: str
+    country: str
+    fields: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ReviewsQuery:
+    """Inputs for the Reviews tab's "Get Fields" action."""
+
+    __slots__ = ("app_id", "count", "lang", "country", "sort", "fields")
+
+    app_id: str
+    count: int
+    lang: str
+    country: str
+    sort: str
+    fields: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class DeveloperQuery:
+    """Inputs for the Developer tab's "Get Fields" action."""
+
+    __slots__ = ("dev_id", "count", "lang", "country", "fields")
+
+    dev_id: str
+    count: int
+    lang: str
+    country: str
+    fields: tuple[str, ...]
+
 
 class GPlayScraperUI:
     """Main Tkinter application window."""
 
+    __slots__ = ("root", "scraper", "status_var", "result_text", "_executor", "_closed")
+
     def __init__(self, root: tk.Tk) -> None:
+        _load_tkinter()
         self.root = root
         self.root.title("GPlay Scraper UI")
         self.root.geometry("900x650")
 
         self.scraper = GPlayScraper()
+        # Reuse worker threads across clicks instead of spawning one each time.
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._closed = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self._build_layout()
 
@@ -47,7 +124,15 @@ class GPlayScraperUI:
         result_frame.columnconfigure(0, weight=1)
         result_frame.rowconfigure(0, weight=1)
 
-        self.result_text = tk.Text(result_frame, wrap=tk.NONE)
+        # Read-only viewer: skip undo bookkeeping on multi-MB inserts.
+        self.result_text = tk.Text(
+            result_frame,
+            wrap=tk.NONE,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            state=tk.DISABLED,
+        )
         self.result_text.grid(row=0, column=0, sticky="nsew")
 
         y_scroll = ttk.Scrollbar(result_frame, orient=tk.VERTICAL, command=self.result_text.yview)
@@ -128,11 +213,13 @@ class GPlayScraperUI:
             button_frame,
             text="Get Fields",
             command=lambda: self._handle_app_fields(
-                app_id_var.get(),
-                self._split_fields(fields_var.get()),
-                lang_var.get(),
-                country_var.get(),
-                assets_var.get() or None,
+                AppQuery(
+                    app_id_var.get(),
+                    lang_var.get(),
+                    country_var.get(),
+                    assets_var.get() or None,
+                    self._split_fields(fields_var.get()),
+                )
             ),
         ).pack(side=tk.LEFT, padx=5)
 
@@ -179,11 +266,13 @@ class GPlayScraperUI:
             button_frame,
             text="Get Fields",
             command=lambda: self._handle_search_fields(
-                query_var.get(),
-                self._split_fields(fields_var.get()),
-                count_var.get(),
-                lang_var.get(),
-                country_var.get(),
+                SearchQuery(
+                    query_var.get(),
+                    count_var.get(),
+                    lang_var.get(),
+                    country_var.get(),
+                    self._split_fields(fields_var.get()),
+                )
             ),
         ).pack(side=tk.LEFT, padx=5)
 
@@ -236,12 +325,14 @@ class GPlayScraperUI:
             button_frame,
             text="Get Fields",
             command=lambda: self._handle_reviews_fields(
-                app_id_var.get(),
-                self._split_fields(fields_var.get()),
-                count_var.get(),
-                lang_var.get(),
-                country_var.get(),
-                sort_var.get(),
+                ReviewsQuery(
+                    app_id_var.get(),
+                    count_var.get(),
+                    lang_var.get(),
+                    country_var.get(),
+                    sort_var.get(),
+                    self._split_fields(fields_var.get()),
+                )
             ),
         ).pack(side=tk.LEFT, padx=5)
 
@@ -288,101 +379,74 @@ class GPlayScraperUI:
             button_frame,
             text="Get Fields",
             command=lambda: self._handle_developer_fields(
-                dev_id_var.get(),
-                self._split_fields(fields_var.get()),
-                count_var.get(),
-                lang_var.get(),
-                country_var.get(),
+                DeveloperQuery(
+                    dev_id_var.get(),
+                    count_var.get(),
+                    lang_var.get(),
+                    country_var.get(),
+                    self._split_fields(fields_var.get()),
+                )
             ),
         ).pack(side=tk.LEFT, padx=5)
 
     # ------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------
-    def _handle_app_fields(
-        self,
-        app_id: str,
-        fields: Iterable[str],
-        lang: str,
-        country: str,
-        assets: str | None,
-    ) -> None:
-        if not fields:
+    def _handle_app_fields(self, q: AppQuery) -> None:
+        if not q.fields:
             messagebox.showinfo("Fields Required", "Please provide at least one field name.")
             return
 
         self._run_async(
             self.scraper.app_get_fields,
-            app_id,
-            list(fields),
-            lang,
-            country,
-            assets,
+            q.app_id,
+            list(q.fields),
+            q.lang,
+            q.country,
+            q.assets,
         )
 
-    def _handle_search_fields(
-        self,
-        query: str,
-        fields: Iterable[str],
-        count: int,
-        lang: str,
-        country: str,
-    ) -> None:
-        if not fields:
+    def _handle_search_fields(self, q: SearchQuery) -> None:
+        if not q.fields:
             messagebox.showinfo("Fields Required", "Please provide at least one field name.")
             return
 
         self._run_async(
             self.scraper.search_get_fields,
-            query,
-            list(fields),
-            count,
-            lang,
-            country,
+            q.query,
+            list(q.fields),
+            q.count,
+            q.lang,
+            q.country,
         )
 
-    def _handle_reviews_fields(
-        self,
-        app_id: str,
-        fields: Iterable[str],
-        count: int,
-        lang: str,
-        country: str,
-        sort: str,
-    ) -> None:
-        if not fields:
+    def _handle_reviews_fields(self, q: ReviewsQuery) -> None:
+        if not q.fields:
             messagebox.showinfo("Fields Required", "Please provide at least one field name.")
             return
 
         self._run_async(
             self.scraper.reviews_get_fields,
-            app_id,
-            list(fields),
-            count,
-            lang,
-            country,
-            sort,
+            q.app_id,
+            list(q.fields),
+            q.count,
+            q.lang,
+            q.country,
+            q.sort,
         )
 
-    def _handle_developer_fields(
-        self,
-        dev_id: str,
-        fields: Iterable[str],
-        count: int,
-        lang: str,
-        country: str,
-    ) -> None:
-        if not fields:
+    def _handle_developer_fields(self, q: DeveloperQuery) -> None:
+        if not q.fields:
             messagebox.showinfo("Fields Required", "Please provide at least one field name.")
             return
 
         self._run_async(
             self.scraper.developer_get_fields,
-            dev_id,
-            list(fields),
-            count,
-            lang,
-            country,
+            q.dev_id,
+            list(q.fields),
+            q.count,
+            q.lang,
+            q.country,
         )
 
     # ------------------------------------------------------------------
@@ -392,20 +456,51 @@ class GPlayScraperUI:
         self._set_status("Running...")
         self._clear_results()
 
-        def task() -> None:
-            try:
-                data = func(*args)
-            except GPlayScraperError as exc:
-                self.root.after(0, lambda: self._handle_error(f"Scraper error: {exc}"))
-            except Exception as exc:  # pragma: no cover - unexpected errors
-                self.root.after(0, lambda: self._handle_error(f"Unexpected error: {exc}"))
-            else:
-                self.root.after(0, lambda: self._handle_success(data))
+        future = self._executor.submit(self._execute, func, *args)
+        future.add_done_callback(self._on_done)
 
-        threading.Thread(target=task, daemon=True).start()
+    def _execute(self, func: Any, *args: Any) -> str:
+        # Serialise on the worker so large payloads don't stall Tk.
+        return self._format_result(func(*args))
 
-    def _handle_success(self, data: Any) -> None:
-        self._display_result(data)
+    def _on_done(self, future: Future) -> None:
+        # The window may be gone by the time a scrape finishes.
+        if self._closed or future.cancelled():
+            return
+        exc = future.exception()
+        if exc is None:
+            pretty = future.result()
+            self._schedule(lambda: self._handle_success(pretty))
+        elif isinstance(exc, GPlayScraperError):
+            self._schedule(lambda: self._handle_error(f"Scraper error: {exc}"))
+        else:  # pragma: no cover - unexpected errors
+            self._schedule(lambda: self._handle_error(f"Unexpected error: {exc}"))
+
+    def _schedule(self, callback: Any) -> None:
+        # Called from a worker thread, so the window can close at any point;
+        # re-check on the Tk thread and tolerate a root that is already gone.
+        def run() -> None:
+            if not self._closed:
+                callback()
+
+        try:
+            self.root.after(0, run)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _on_close(self) -> None:
+        # Pool workers are not daemon threads: the interpreter still waits for
+        # a scrape that is already running before the process exits.  Queued
+        # ones are cancelled (Python 3.9+) and no result reaches the dead UI.
+        self._closed = True
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=False)
+        self.root.destroy()
+
+    def _handle_success(self, pretty: str) -> None:
+        self._display_result(pretty)
         self._set_status("Finished")
 
     def _handle_error(self, message: str) -> None:
@@ -414,12 +509,21 @@ class GPlayScraperUI:
     # ------------------------------------------------------------------
     # Result helpers
     # ------------------------------------------------------------------
-    def _display_result(self, data: Any) -> None:
-        pretty = json.dumps(data, indent=2, ensure_ascii=False)
-        self.result_text.insert("1.0", pretty)
+    @staticmethod
+    def _format_result(data: Any) -> str:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    def _display_result(self, pretty: str) -> None:
+        # The viewer is kept read-only; unlock it only for the single append.
+        self.result_text.configure(state=tk.NORMAL)
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, pretty)
+        self.result_text.configure(state=tk.DISABLED)
 
     def _clear_results(self) -> None:
+        self.result_text.configure(state=tk.NORMAL)
         self.result_text.delete("1.0", tk.END)
+        self.result_text.configure(state=tk.DISABLED)
 
     def _set_status(self, message: str) -> None:
         self.status_var.set(message)
@@ -432,11 +536,12 @@ class GPlayScraperUI:
     # Utilities
     # ------------------------------------------------------------------
     @staticmethod
-    def _split_fields(raw: str) -> list[str]:
-        return [field.strip() for field in raw.split(",") if field.strip()]
+    def _split_fields(raw: str) -> tuple[str, ...]:
+        return tuple(field for field in _FIELD_SPLIT.split(raw.strip()) if field)
 
 
 def main() -> None:
+    _load_tkinter()
     root = tk.Tk()
     GPlayScraperUI(root)
     root.mainloop()
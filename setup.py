@@ -40,10 +40,12 @@ setup(
             "cloudscraper>=1.2.0",
             "aiohttp>=3.8.0",
         ],
+        "api": ["orjson>=3.9.0"],
         "all": [
             "pytest>=7.0.0", "pytest-cov>=4.0.0", "black>=22.0.0", "flake8>=5.0.0",
             "curl-cffi>=0.5.0", "tls-client>=0.2.0", "httpx>=0.24.0", 
             "urllib3>=1.26.0", "cloudscraper>=1.2.0", "aiohttp>=3.8.0",
+            "orjson>=3.9.0",
         ],
     },
     python_requires=">=3.8",
@@ -0,0 +1,207 @@
+import importlib
+import json
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add the parent directory to the path to import the serverless API module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import index
+
+
+class FakeRequest:
+    """Minimal stand-in for the runtime's request object"""
+
+    def __init__(self, args=None, method="GET"):
+        self.method = method
+        self.args = args or {}
+
+
+class TestArgumentParsing(unittest.TestCase):
+    """Tests for query-string parsing helpers"""
+
+    def test_parse_fields(self):
+        """Test that fields are split on commas with surrounding whitespace dropped"""
+        self.assertEqual(index._parse_fields(" a , b c ,, d "), ["a", "b c", "d"])
+
+    def test_parse_fields_empty(self):
+        """Test that missing or blank fields give an empty list"""
+        self.assertEqual(index._parse_fields(None), [])
+        self.assertEqual(index._parse_fields(""), [])
+        self.assertEqual(index._parse_fields(" , "), [])
+
+
+class TestResponseStreaming(unittest.TestCase):
+    """Tests for JSON encoding of API responses (no network access)"""
+
+    def _decode(self, body):
+        if isinstance(body, bytes):
+            return json.loads(body)
+        return json.loads(b"".join(body))
+
+    def test_round_trip_around_stream_threshold(self):
+        """Test that bodies decode to the payload below, at and above the threshold"""
+        for size in (index._STREAM_THRESHOLD - 1, index._STREAM_THRESHOLD, index._STREAM_THRESHOLD + 1):
+            payload = {"data": [{"id": i, "title": "App ü %d" % i, "score": None} for i in range(size)]}
+            body, status, headers = index._build_response(200, payload)
+            self.assertEqual(self._decode(body), payload)
+            self.assertEqual(status, 200)
+            self.assertEqual(headers["Content-Type"], "application/json")
+
+    def test_only_large_lists_are_streamed(self):
+        """Test that small payloads are buffered and large lists are chunked"""
+        small, _, _ = index._build_response(200, {"data": [1] * index._STREAM_THRESHOLD})
+        large, _, _ = index._build_response(200, {"data": [1] * (index._STREAM_THRESHOLD + 1)})
+        self.assertIsInstance(small, bytes)
+        self.assertNotIsInstance(large, bytes)
+
+    def test_empty_list_round_trip(self):
+        """Test that an empty chunked list is still valid JSON"""
+        self.assertEqual(self._decode(index._iter_data_chunks([])), {"data": []})
+
+    def test_items_are_batched_into_chunks(self):
+        """Test that chunks hold many items and only the last is under the chunk size"""
+        items = [{"id": i, "text": "x" * 200} for i in range(2000)]
+        chunks = list(index._iter_data_chunks(items))
+        self.assertLess(len(chunks), len(items) // 10)
+        for chunk in chunks[:-1]:
+            self.assertGreaterEqual(len(chunk), index._STREAM_CHUNK_SIZE)
+        self.assertEqual(json.loads(b"".join(chunks)), {"data": items})
+
+    def test_small_streamed_list_is_single_chunk(self):
+        """Test that a list just over the threshold is sent as one write"""
+        items = [{"id": i} for i in range(index._STREAM_THRESHOLD + 1)]
+        self.assertEqual(len(list(index._iter_data_chunks(items))), 1)
+
+
+class TestScraperCache(unittest.TestCase):
+    """Tests for the TTL cache in front of scraper calls (no network access)"""
+
+    def setUp(self):
+        index._cache.clear()
+        self.scraper = mock.Mock()
+        self.scraper.search_analyze.return_value = [{"appId": "com.example"}]
+        patcher = mock.patch.object(index, "scraper", self.scraper)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(index._cache.clear)
+
+    def test_identical_calls_hit_cache(self):
+        """Test that a repeated call is served without calling the scraper again"""
+        first = index._call("search_analyze", "notes", 10, "en", "us")
+        second = index._call("search_analyze", "notes", 10, "en", "us")
+        self.assertEqual(first, second)
+        self.assertEqual(self.scraper.search_analyze.call_count, 1)
+
+    def test_different_arguments_miss_cache(self):
+        """Test that different arguments are cached separately"""
+        index._call("search_analyze", "notes", 10, "en", "us")
+        index._call("search_analyze", "notes", 20, "en", "us")
+        self.assertEqual(self.scraper.search_analyze.call_count, 2)
+
+    def test_entries_expire_after_ttl(self):
+        """Test that an entry is refetched once its TTL has elapsed"""
+        with mock.patch.object(index.time, "monotonic", return_value=1000.0):
+            index._call("search_analyze", "notes", 10, "en", "us")
+        with mock.patch.object(index.time, "monotonic", return_value=1000.0 + index._CACHE_TTL - 1):
+            index._call("search_analyze", "notes", 10, "en", "us")
+        self.assertEqual(self.scraper.search_analyze.call_count, 1)
+        with mock.patch.object(index.time, "monotonic", return_value=1000.0 + index._CACHE_TTL):
+            index._call("search_analyze", "notes", 10, "en", "us")
+        self.assertEqual(self.scraper.search_analyze.call_count, 2)
+
+    def test_empty_results_are_not_cached(self):
+        """Test that empty results (swallowed scraper errors) are never reused"""
+        for empty in ([], None):
+            self.scraper.search_analyze.reset_mock()
+            self.scraper.search_analyze.return_value = empty
+            index._call("search_analyze", "notes", 10, "en", "us")
+            index._call("search_analyze", "notes", 10, "en", "us")
+            self.assertEqual(self.scraper.search_analyze.call_count, 2)
+        self.assertEqual(len(index._cache), 0)
+
+    def test_cache_is_bounded(self):
+        """Test that the oldest entry is evicted past the maximum size"""
+        with mock.patch.object(index, "_CACHE_MAXSIZE", 2):
+            for query in ("a", "b", "c"):
+                index._call("search_analyze", query, 10, "en", "us")
+        self.assertEqual(len(index._cache), 2)
+        self.assertNotIn(("search_analyze", "a", 10, "en", "us"), index._cache)
+
+    def test_ttl_zero_disables_cache(self):
+        """Test that GPLAY_API_CACHE_TTL=0 sends every call to the scraper"""
+        with mock.patch.dict(os.environ, {"GPLAY_API_CACHE_TTL": "0"}):
+            importlib.reload(index)
+        self.addCleanup(importlib.reload, index)
+        self.assertEqual(index._CACHE_TTL, 0)
+
+        with mock.patch.object(index, "scraper", self.scraper):
+            index._call("search_analyze", "notes", 10, "en", "us")
+            index._call("search_analyze", "notes", 10, "en", "us")
+        self.assertEqual(self.scraper.search_analyze.call_count, 2)
+        self.assertEqual(len(index._cache), 0)
+
+
+class TestHandlerDispatch(unittest.TestCase):
+    """Tests for request dispatch in the handler (no network access)"""
+
+    def setUp(self):
+        index._cache.clear()
+        self.addCleanup(index._cache.clear)
+
+    def _call(self, args, method="GET"):
+        body, status, headers = index.handler(FakeRequest(args, method))
+        return json.loads(body) if body else body, status, headers
+
+    def test_options_preflight(self):
+        """Test that OPTIONS returns an empty 204 with the CORS headers"""
+        body, status, headers = index.handler(FakeRequest(method="OPTIONS"))
+        self.assertEqual((body, status), (b"", 204))
+        self.assertEqual(headers["Access-Control-Allow-Origin"], "*")
+        self.assertEqual(headers["Access-Control-Allow-Methods"], "GET, OPTIONS")
+        self.assertEqual(headers["Access-Control-Allow-Headers"], "*")
+
+    def test_warmup_action(self):
+        """Test that the warmup action answers without touching the scraper"""
+        with mock.patch.object(index, "scraper") as scraper:
+            payload, status, _ = self._call({"action": "warmup"})
+        self.assertEqual(status, 200)
+        self.assertEqual(payload, {"data": {"status": "warm"}})
+        self.assertEqual(scraper.mock_calls, [])
+
+    def test_action_is_case_insensitive(self):
+        """Test that action=APP dispatches to the app handler"""
+        with mock.patch.object(index, "scraper") as scraper:
+            scraper.app_analyze.return_value = {"appId": "com.example"}
+            payload, status, _ = self._call({"action": "APP", "appId": "com.example"})
+        self.assertEqual(status, 200)
+        self.assertEqual(payload, {"data": {"appId": "com.example"}})
+        scraper.app_analyze.assert_called_once_with("com.example", *index._LOCALE_DEFAULTS, None)
+
+    def test_missing_action(self):
+        """Test that a request without an action is rejected"""
+        payload, status, _ = self._call({})
+        self.assertEqual(status, 400)
+        self.assertEqual(payload, {"error": "Missing 'action' query parameter."})
+
+    def test_missing_required_parameter(self):
+        """Test that shared error payloads encode with and without orjson"""
+        for encoder in (index.orjson, None):
+            with mock.patch.object(index, "orjson", encoder):
+                payload, status, _ = self._call({"action": "app"})
+            self.assertEqual(status, 400)
+            self.assertEqual(payload, {"error": "Missing required 'appId' parameter."})
+        with self.assertRaises(TypeError):
+            index._ERR_MISSING_APP_ID["error"] = "changed"
+
+    def test_unknown_action(self):
+        """Test that an unknown action is rejected and echoed back"""
+        payload, status, _ = self._call({"action": "Bogus"})
+        self.assertEqual(status, 400)
+        self.assertEqual(payload, {"error": "Unsupported action 'Bogus'."})
+
+
+if __name__ == '__main__':
+    unittest.main()